@@ -1,6 +1,7 @@
 # main.py
 # (Rest of your code, including imports)
 
+import importlib
 import sys
 import os
 
@@ -8,30 +9,52 @@ import os
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
-# Import the necessary modules
-try:
-    from scripts import generate_bin_data
-    from scripts import generate_suburb_data
-    from mqtt_publisher import publish_suburb_data
-    from mqtt_publisher import publish_bin_data
-    from mqtt_subscriber import subscribe_data  # Import the subscriber
-except ImportError as e:
-    print(f"Error importing project modules: {e}")
-    print("Please ensure you are running this script from the project root directory.")
-    print("Also, check that the subdirectories exist and contain the necessary files.")
-    sys.exit(1)
+
+def load_module(module_name: str):
+    """
+    Imports a project module on first use, so only the tool picked from the
+    menu pays for its imports (e.g. NumPy/pandas or the MQTT client).
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        print(f"Error importing project modules: {e}")
+        print("Please ensure you are running this script from the project root directory.")
+        print("Also, check that the subdirectories exist and contain the necessary files.")
+        sys.exit(1)
+
+
+MAIN_MENU = "\n".join([
+    "\n--- Smart Dustbin Project Menu ---",
+    "1. Run Bin Data Generator",
+    "2. Run Suburb Data Generator",
+    "3. Run MQTT Publisher",
+    "4. Run MQTT Subscriber",
+    "5. Publish Suburb Data",
+    "6. Exit",
+    "-" * 35,
+])
+
+EXIT_CHOICE = '6'
+
+# Menu choice -> (start message, module, entry point, finish message)
+MENU_ACTIONS = {
+    '1': ("\nStarting Bin Data Generator...", "scripts.generate_bin_data", "main_menu",
+          "\nBin Data Generator finished."),
+    '2': ("\nStarting Suburb Data Generator...", "scripts.generate_suburb_data", "main_menu",
+          "\nSuburb Data Generator finished."),
+    '3': ("\nStarting MQTT Publisher...", "mqtt_publisher.publish_bin_data", "main",
+          "\nMQTT Publisher finished."),
+    '4': ("\nStarting MQTT Subscriber...", "mqtt_subscriber.subscribe_data", "main",
+          "\nMQTT Subscriber is running... (It will keep running until interrupted)"),
+    '5': ("\nPublishing Suburb Data...", "mqtt_publisher.publish_suburb_data", "main",
+          "\nSuburb Data Publisher finished."),
+}
 
 
 def display_main_menu():
     """Displays the main project menu."""
-    print("\n--- Smart Dustbin Project Menu ---")
-    print("1. Run Bin Data Generator")
-    print("2. Run Suburb Data Generator")
-    print("3. Run MQTT Publisher")
-    print("4. Run MQTT Subscriber")  # NEW: Option to run the subscriber
-    print("5. Publish Suburb Data")
-    print("6. Exit")
-    print("-" * 35)
+    print(MAIN_MENU)
 
 
 def main():
@@ -40,27 +63,13 @@ def main():
         display_main_menu()
         choice = input("Enter your choice: ")
 
-        if choice == '1':
-            print("\nStarting Bin Data Generator...")
-            generate_bin_data.main_menu()
-            print("\nBin Data Generator finished.")
-        elif choice == '2':
-            print("\nStarting Suburb Data Generator...")
-            generate_suburb_data.main_menu()
-            print("\nSuburb Data Generator finished.")
-        elif choice == '3':
-            print("\nStarting MQTT Publisher...")
-            publish_bin_data.main()
-            print("\nMQTT Publisher finished.")
-        elif choice == '4':
-            print("\nStarting MQTT Subscriber...")
-            subscribe_data.main()  # Call the subscriber's main function
-            print("\nMQTT Subscriber is running... (It will keep running until interrupted)")
-        elif choice == '5':
-            print("\nPublishing Suburb Data...")
-            publish_suburb_data.main()  # Call the publisher for suburb data
-            print("\nSuburb Data Publisher finished.")
-        elif choice == '6':
+        action = MENU_ACTIONS.get(choice)
+        if action is not None:
+            start_message, module_name, entry_point, finish_message = action
+            print(start_message)
+            getattr(load_module(module_name), entry_point)()
+            print(finish_message)
+        elif choice == EXIT_CHOICE:
             print("Exiting Smart Dustbin Project.")
             break
         else:
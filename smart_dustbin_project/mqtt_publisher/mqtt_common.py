@@ -0,0 +1,123 @@
+# mqtt_publisher/mqtt_common.py
+# MQTT connection settings and network loop helpers shared by the publishers.
+
+import paho.mqtt.client as mqtt
+import json
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any
+
+# orjson encodes dict payloads several times faster than json and returns
+# bytes, which paho publishes as-is. Fall back to json if it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# --- MQTT Configuration ---
+QOS = 0  # Fire-and-forget by default; set to 1 or 2 for broker acknowledgements
+INFLIGHT_WINDOW = 256  # Unconfirmed messages allowed before the publish loop blocks
+CONFIRM_TIMEOUT = 10  # Seconds to wait for a single message to be confirmed
+CONNECT_TIMEOUT = 10  # Seconds to wait for the broker's CONNACK
+NETWORK_POLL_TIMEOUT = 1.0  # Longest single network loop pass; it returns early on socket activity
+SOCKET_SEND_BUFFER = 1 << 20  # 1 MiB kernel send buffer so publish bursts don't stall the network loop
+
+# Set by on_connect once the broker accepts the connection
+connected = threading.Event()
+
+
+def dumps_payload(data: Any) -> bytes:
+    """Serializes a message payload to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def loads_payload(raw: bytes) -> Any:
+    """Parses JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def track_inflight(client: mqtt.Client, inflight: deque, info: mqtt.MQTTMessageInfo) -> int:
+    """
+    Records a just-published message. Once INFLIGHT_WINDOW messages are
+    outstanding, waits for the oldest to be sent (QoS 0) or acknowledged
+    (QoS 1/2), so many round trips overlap instead of one at a time.
+
+    Returns the number of messages given up on after CONFIRM_TIMEOUT (0 or 1).
+    """
+    inflight.append(info)
+    if len(inflight) >= INFLIGHT_WINDOW:
+        if not run_network_until(client, inflight.popleft().is_published, CONFIRM_TIMEOUT):
+            return 1
+    return 0
+
+
+def drain_inflight(client: mqtt.Client, inflight: deque) -> int:
+    """
+    Waits for every outstanding message to be confirmed. Returns the number
+    of messages that were not confirmed within CONFIRM_TIMEOUT.
+    """
+    unconfirmed = 0
+    while inflight:
+        if not run_network_until(client, inflight.popleft().is_published, CONFIRM_TIMEOUT):
+            unconfirmed += 1
+    return unconfirmed
+
+
+def run_network_until(client: mqtt.Client, done, timeout: float) -> bool:
+    """
+    Drives paho's network loop on the calling thread until done() returns True
+    or timeout seconds pass, and returns done()'s final result. The publishers
+    have no background network thread, so this is where pending writes are
+    flushed and acknowledgements are read.
+
+    Raises RuntimeError if the network loop fails (e.g. the broker drops the
+    connection).
+    """
+    deadline = time.monotonic() + timeout
+    while not done():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        rc = client.loop(timeout=min(remaining, NETWORK_POLL_TIMEOUT))
+        if rc != mqtt.MQTT_ERR_SUCCESS:
+            raise RuntimeError(f"MQTT network loop failed: {mqtt.error_string(rc)}")
+    return True
+
+
+def wait_for_connection(client: mqtt.Client) -> bool:
+    """
+    Drives the network loop until on_connect sets `connected` or
+    CONNECT_TIMEOUT passes, and returns whether the broker accepted the
+    connection. Call after client.connect().
+    """
+    # `connected` is shared by every publisher run in the process (e.g. from
+    # the main.py menu), so forget any earlier connection first. on_connect
+    # only fires from the network loop, so this cannot miss the CONNACK.
+    connected.clear()
+    try:
+        return run_network_until(client, connected.is_set, CONNECT_TIMEOUT)
+    except RuntimeError as e:
+        print(f"An error occurred during connection: {e}")
+        return False
+
+
+def tune_socket(client: mqtt.Client):
+    """
+    Disables Nagle's algorithm on the client's socket so small publishes go out
+    immediately instead of waiting on the broker's delayed ACKs, and enlarges
+    the send buffer. Called from on_connect so reconnects are tuned too.
+    """
+    sock = client.socket()
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER)
+    except OSError as e:
+        print(f"Warning: Could not tune MQTT socket options: {e}")
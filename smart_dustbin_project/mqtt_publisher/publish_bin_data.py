@@ -1,11 +1,14 @@
 # mqtt_publisher/publish_bin_data.py
-# Script to read generated bin data from JSON and publish to MQTT in parallel.
+# Script to read generated bin data from JSON and publish to MQTT.
 
 import paho.mqtt.client as mqtt
-import json
+import gzip
 import os
-import time
-import concurrent.futures
+from collections import deque
+
+from .mqtt_common import (QOS, INFLIGHT_WINDOW, CONFIRM_TIMEOUT, connected, dumps_payload,
+                          loads_payload, track_inflight, drain_inflight, wait_for_connection,
+                          tune_socket)
 
 
 # --- MQTT Configuration ---
@@ -17,28 +20,63 @@ TOPIC_BINS = TOPIC_BASE + "bins"  # Topic for bin data
 # --- Data File Paths ---
 DATA_DIR = "generated_bin_data/"
 BINS_JSON = os.path.join(DATA_DIR, "bins.json")
+BINS_JSON_GZ = BINS_JSON + ".gz"  # Written instead of bins.json when the generator compresses output
 
 
 # --- Helper Functions ---
 def read_json_data(filepath: str) -> list:
     """Reads data from a JSON file and returns a list of dictionaries."""
-    data = []
-    if os.path.exists(filepath):
-        with open(filepath, mode='r', encoding='utf-8') as file:
-            data = json.load(file)  # Load the entire JSON file
-    return data
+    opener = gzip.open if filepath.endswith(".gz") else open
+    try:
+        with opener(filepath, mode='rb') as file:
+            raw = file.read()  # Load the entire JSON file
+    except FileNotFoundError:
+        return []
+    return loads_payload(raw)
+
+
+def latest_bins_path() -> str:
+    """
+    Returns whichever of bins.json and bins.json.gz was written most recently,
+    so a leftover file from an earlier run in the other format is never
+    republished. Falls back to bins.json when neither exists.
+    """
+    existing = [path for path in (BINS_JSON, BINS_JSON_GZ) if os.path.exists(path)]
+    return max(existing, key=os.path.getmtime, default=BINS_JSON)
 
 
 def publish_bin_data(client: mqtt.Client, topic: str, data: list):
-    """Publishes a list of bin data dictionaries to the specified MQTT topic in parallel."""
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = []
-        for i, bin_data in enumerate(data):
-            futures.append(executor.submit(client.publish, topic, json.dumps(bin_data)))
-            progress = int((i + 1) / len(data) * 100)
-            print(f"\rPublishing bin data... {progress}%", end="")
-        for future in concurrent.futures.as_completed(futures):
-            future.result()
+    """
+    Publishes a list of bin data dictionaries to the specified MQTT topic.
+
+    Messages are handed straight to paho's outbound queue from this thread (the
+    client writes everything through one socket anyway), with up to INFLIGHT_WINDOW
+    unconfirmed at a time and a final drain once the last one is queued.
+    """
+    # Encode everything up front so the publish loop only hands bytes to paho
+    payloads = [dumps_payload(bin_data) for bin_data in data]
+    # Refresh the progress line about once per percent rather than per message
+    progress_step = max(1, len(payloads) // 100)
+    inflight = deque()
+    count = 0
+    unconfirmed = 0  # Messages not confirmed within CONFIRM_TIMEOUT
+    # A publish or network error (e.g. the broker dropping the connection)
+    # means the client is unusable, so stop here and report it.
+    try:
+        for payload in payloads:
+            unconfirmed += track_inflight(client, inflight, client.publish(topic, payload, qos=QOS))
+            count += 1
+            if count % progress_step == 0:
+                print(f"\rPublishing bin data... {count * 100 // len(payloads)}%", end="", flush=True)
+        unconfirmed += drain_inflight(client, inflight)
+    except Exception as e:
+        print(f"\nError publishing message {count + 1} of {len(payloads)} to {topic}. Error: {e}")
+        return
+    if unconfirmed:
+        print(f"\nWarning: {unconfirmed} of {len(payloads)} messages were not confirmed within "
+              f"{CONFIRM_TIMEOUT} seconds and may not have been delivered.", end="")
+    else:
+        print(f"\rPublishing bin data... 100% ({len(payloads)} messages)", end="")
 
 
 # --- MQTT Callbacks ---
@@ -46,6 +84,8 @@ def on_connect(client, userdata, flags, rc):
     """Callback for when the client connects to the MQTT broker."""
     if rc == 0:
         print("Connected to MQTT broker.")
+        tune_socket(client)
+        connected.set()
     else:
         print(f"Connection failed with code {rc}")
 
@@ -57,9 +97,10 @@ def on_disconnect(client, userdata, rc):
 
 # --- Main Function ---
 def main():
-    """Main function to connect to MQTT, publish bin data in parallel, and disconnect."""
+    """Main function to connect to MQTT, publish bin data, and disconnect."""
 
     client = mqtt.Client()
+    client.max_inflight_messages_set(INFLIGHT_WINDOW)  # Let paho keep the whole window in flight at QoS 1/2
 
     # Set up callbacks
     client.on_connect = on_connect
@@ -68,22 +109,27 @@ def main():
     # Connect to the MQTT broker
     print(f"Connecting to MQTT broker: {MQTT_BROKER_ADDRESS}:{MQTT_PORT}")
     client.connect(MQTT_BROKER_ADDRESS, MQTT_PORT, 60)
-    client.loop_start()  # Start the MQTT loop in a separate thread
 
-    time.sleep(5)  # Allow time for connection to establish
+    # Wait for the broker to accept the connection. The network loop is driven
+    # from this thread (see mqtt_common.run_network_until) rather than by
+    # loop_start()'s background thread, which would contend with the publish
+    # loop for the GIL.
+    if not wait_for_connection(client):
+        print("MQTT client failed to connect. Exiting.")
+        return
 
     # --- Publishing Logic ---
 
-    bin_data = read_json_data(BINS_JSON)
+    bins_path = latest_bins_path()
+    bin_data = read_json_data(bins_path)
     if bin_data:
         publish_bin_data(client, TOPIC_BINS, bin_data)
     else:
-        print(f"No data found in {BINS_JSON}. Skipping bin data publishing.")
+        print(f"No data found in {bins_path}. Skipping bin data publishing.")
 
     # --- Disconnect ---
     print("\nFinished publishing bin data.")
     print("Disconnecting from MQTT broker.")
-    client.loop_stop()
     client.disconnect()
 
 
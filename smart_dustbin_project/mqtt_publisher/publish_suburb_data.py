@@ -1,18 +1,24 @@
 # mqtt_publisher/publish_suburb_data.py
-# Script to read generated suburb model data from CSVs and publish to MQTT in parallel.
+# Script to read generated suburb model data from CSVs and publish to MQTT.
 
 import paho.mqtt.client as mqtt
-import json
 import csv
 import os
-import time
 import sys
 import concurrent.futures
-from typing import List, Dict, Any, Tuple
+import functools
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .mqtt_common import (QOS, INFLIGHT_WINDOW, CONFIRM_TIMEOUT, connected, dumps_payload,
+                          track_inflight, drain_inflight, run_network_until,
+                          wait_for_connection, tune_socket)
 
 # --- MQTT Configuration ---
 MQTT_BROKER_ADDRESS = "test.mosquitto.org"
 MQTT_PORT = 1883
+DAEMON_FLAG = "--daemon"  # Stay connected and republish on each line read from stdin
+BATCH_SIZE = 500  # Records per JSON array message on the batch topics; 1 publishes one message per record
 
 # --- MQTT Topics ---
 TOPIC_BASE = "suburb/model/igention/"
@@ -20,6 +26,7 @@ TOPIC_DRIVEWAYS = TOPIC_BASE + "driveways"
 TOPIC_HOUSES = TOPIC_BASE + "houses"
 TOPIC_STREETS = TOPIC_BASE + "streets"
 TOPIC_SUBURB = TOPIC_BASE + "suburb"
+BATCH_TOPIC_SUFFIX = "/batch"  # Appended to a topic when its records are published in batches
 
 # --- Data File Paths ---
 DATA_DIR = "generated_suburb_data/"
@@ -28,84 +35,185 @@ HOUSES_CSV = os.path.join(DATA_DIR, "houses.csv")
 STREETS_CSV = os.path.join(DATA_DIR, "streets.csv")
 SUBURB_CSV = os.path.join(DATA_DIR, "suburb.csv")
 
+IO_BUFFER_SIZE = 1 << 20 # 1 MiB read buffer for the CSV files
+
 # --- Helper Functions ---
-def read_csv_data(filepath: str) -> List[Dict[str, str]]:
-    data = []
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                data = list(reader)
-        except FileNotFoundError:
-            print(f"Error: File not found at {filepath}")
-        except Exception as e:
-            print(f"Error reading CSV file {filepath}: {e}")
-    else:
+def padded_rows(reader: Iterable[List[str]], width: int) -> Iterator[List[Optional[str]]]:
+    """
+    Yields the non-empty rows of a csv.reader, padding short rows with None up
+    to width fields, as csv.DictReader does for missing values.
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([None] * (width - len(row)))
+        yield row
+
+def read_csv_data(filepath: str) -> List[bytes]:
+    """
+    Reads a CSV file and returns one ready-to-publish JSON payload per row.
+
+    Rows are parsed positionally and encoded in the same pass; when the file has
+    'latitude' and 'longitude' columns they are replaced by a nested 'location'
+    object with float coordinates. Blank lines are skipped and missing trailing
+    fields become null.
+    """
+    payloads = []
+    try:
+        with open(filepath, mode='r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            if 'latitude' not in header or 'longitude' not in header:
+                # All-string rows: copy the fields straight through
+                fields = list(enumerate(header))
+                for row in padded_rows(reader, len(header)):
+                    payloads.append(dumps_payload({name: row[i] for i, name in fields}))
+            else:
+                lat_i = header.index('latitude')
+                lon_i = header.index('longitude')
+                fields = [(i, name) for i, name in enumerate(header) if i != lat_i and i != lon_i]
+                for row in padded_rows(reader, len(header)):
+                    try:
+                        location = {"latitude": float(row[lat_i]), "longitude": float(row[lon_i])}
+                    except (ValueError, TypeError):  # TypeError: the row is missing a coordinate
+                        print(f"Warning: Could not parse latitude/longitude for row: {row}. Skipping row.")
+                        continue
+                    record = {name: row[i] for i, name in fields}
+                    record['location'] = location
+                    payloads.append(dumps_payload(record))
+    except FileNotFoundError:
         print(f"Warning: File not found at {filepath}. Skipping.")
-    return data
-
-def format_location_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    for row in data:
-        if 'latitude' in row and 'longitude' in row:
-            row['location'] = {
-                "latitude": float(row.pop('latitude')),
-                "longitude": float(row.pop('longitude'))
-            }
-    return data
-
-def publish_data(client: mqtt.Client, topic: str, data: List[Dict[str, Any]]):
+    except Exception as e:
+        print(f"Error reading CSV file {filepath}: {e}")
+    return payloads
+
+@functools.lru_cache(maxsize=1)
+def read_first_payload(filepath: str, mtime_ns: int) -> Optional[bytes]:
+    """Returns the first row of a CSV as a payload; cached per file version."""
+    payloads = read_csv_data(filepath)
+    return payloads[0] if payloads else None
+
+def get_suburb_payload() -> Optional[bytes]:
+    """
+    Returns the encoded suburb message. The suburb CSV holds a single row and
+    rarely changes, so repeated publisher runs in one session (e.g. from the
+    main.py menu) reuse the encoded bytes until the file is regenerated.
+    """
+    try:
+        mtime_ns = os.stat(SUBURB_CSV).st_mtime_ns
+    except FileNotFoundError:
+        print(f"Warning: File not found at {SUBURB_CSV}. Skipping.")
+        return None
+    return read_first_payload(SUBURB_CSV, mtime_ns)
+
+def batch_payloads(payloads: List[bytes], batch_size: int) -> List[bytes]:
+    """
+    Joins consecutive encoded records into JSON array payloads of up to
+    batch_size records each. The records are already JSON, so they are
+    concatenated as bytes rather than decoded and re-encoded.
+    """
+    return [b"[" + b",".join(payloads[i:i + batch_size]) + b"]"
+            for i in range(0, len(payloads), batch_size)]
+
+def publish_data(client: mqtt.Client, topic: str, data: List[bytes]):
     total_count = len(data)
     if total_count == 0:
         print(f"No data to publish for topic {topic}. Skipping.")
         return
 
     print(f"Starting to publish {total_count} messages to topic {topic}...")
+    # Refresh the progress line about once per percent rather than per message
+    progress_step = max(1, total_count // 100)
+    inflight = deque()
     count = 0
-    for row in data:
-        try:
-            client.publish(topic, json.dumps(row))
+    unconfirmed = 0  # Messages not confirmed within CONFIRM_TIMEOUT
+    # A publish error means the client is unusable, so stop the topic rather
+    # than paying for exception setup on every message.
+    try:
+        for payload in data:
+            unconfirmed += track_inflight(client, inflight, client.publish(topic, payload, qos=QOS))
             count += 1
-            percent_complete = round((count / total_count) * 100, 2)
-            print(f"\rPublishing to topic {topic}: {count}/{total_count} ({percent_complete}%)", end="", flush=True)
-            time.sleep(0.01)
-        except Exception as e:
-            print(f"\nError publishing message to {topic}: {row}. Error: {e}")
-
-    print(f"\nFinished publishing {total_count} messages to topic {topic}.")
-
-def publish_parallel_data(client: mqtt.Client, data_tasks: List[Tuple[str, str]]):
-    print("Starting parallel data publishing...")
-    futures_list = []
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        for topic, filepath in data_tasks:
-            data = read_csv_data(filepath)
-            data = format_location_data(data)
-            if data:
-                future = executor.submit(publish_data, client, topic, data)
-                futures_list.append((future, topic))
-            else:
-                print(f"No data found in {filepath}. Skipping publishing for topic {topic}.")
+            if count % progress_step == 0:
+                print(f"\rPublishing to topic {topic}: {count}/{total_count} ({count * 100 // total_count}%)", end="", flush=True)
+        unconfirmed += drain_inflight(client, inflight)
+    except Exception as e:
+        print(f"\nError publishing message {count + 1} of {total_count} to {topic}. Error: {e}")
+    print(f"\rPublishing to topic {topic}: {count}/{total_count} ({count * 100 // total_count}%)", end="")
 
-        for future, topic in futures_list:
-            try:
-                future.result()
-            except Exception as e:
-                print(f"Error during parallel publishing for topic {topic}: {e}")
+    print(f"\nFinished publishing {count} messages to topic {topic}.")
+    if unconfirmed:
+        print(f"Warning: {unconfirmed} of them were not confirmed within {CONFIRM_TIMEOUT} seconds "
+              f"and may not have been delivered.")
 
-    print("Parallel data publishing finished.")
+def publish_topic_data(client: mqtt.Client, data_tasks: List[Tuple[str, str]]):
+    # CSV files are parsed and encoded in worker processes (the work is CPU-bound
+    # and holds the GIL) while earlier topics are being published. Network writes
+    # stay on this thread: all topics share the client's single connection, so
+    # publishing them in parallel gains nothing.
+    print("Starting data publishing...")
+    num_workers = max(1, min(len(data_tasks), os.cpu_count() or 1))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        read_futures = [executor.submit(read_csv_data, filepath) for _, filepath in data_tasks]
+        for (topic, filepath), read_future in zip(data_tasks, read_futures):
+            publish_file_data(client, topic, filepath, read_future.result())
 
-def publish_single_message(client: mqtt.Client, topic: str, data: Dict[str, Any]):
+    print("Data publishing finished.")
+
+def publish_file_data(client: mqtt.Client, topic: str, filepath: str, data: List[bytes]):
+    if not data:
+        print(f"No data found in {filepath}. Skipping publishing for topic {topic}.")
+        return
+    if BATCH_SIZE > 1:
+        # One PUBLISH per batch instead of per row cuts packet framing and acks
+        print(f"Grouping {len(data)} records from {filepath} into batches of up to {BATCH_SIZE}.")
+        topic = topic + BATCH_TOPIC_SUFFIX
+        data = batch_payloads(data, BATCH_SIZE)
+    try:
+        publish_data(client, topic, data)
+    except Exception as e:
+        print(f"Error during publishing for topic {topic}: {e}")
+
+def publish_single_message(client: mqtt.Client, topic: str, payload: bytes):
     try:
-        client.publish(topic, json.dumps(data))
-        print(f"Published single message to topic {topic}.")
+        info = client.publish(topic, payload, qos=QOS)
+        if run_network_until(client, info.is_published, CONFIRM_TIMEOUT):
+            print(f"Published single message to topic {topic}.")
+        else:
+            print(f"Warning: Message to topic {topic} was not confirmed within {CONFIRM_TIMEOUT} seconds "
+                  f"and may not have been delivered.")
     except Exception as e:
         print(f"Error publishing single message to {topic}: {e}")
 
+def run_daemon(client: mqtt.Client):
+    """
+    Keeps the broker connection open and publishes all data each time a line
+    is read from stdin, until stdin closes or 'quit' is entered. Repeated runs
+    skip the TCP and MQTT connection handshakes.
+    """
+    print("Daemon mode: press Enter to publish all data, or type 'quit' to exit.")
+    while True:
+        # While idle, paho's background thread answers keepalive pings (and
+        # reconnects if needed). It is stopped before publishing so the worker
+        # processes are never forked with it running and the publish loop keeps
+        # driving the network itself.
+        client.loop_start()
+        try:
+            command = input()
+        except EOFError:
+            command = "quit"
+        finally:
+            client.loop_stop()
+        if command.strip() == "quit":
+            return
+        publish_all(client)
+
 # --- MQTT Callbacks ---
 def on_connect(client, userdata, flags, rc):
     if rc == 0:
         print("MQTT Connection established.")
+        tune_socket(client)
+        connected.set()
     else:
         print(f"MQTT Connection failed with code {rc}")
 
@@ -116,8 +224,27 @@ def on_disconnect(client, userdata, rc):
         print("Disconnected from MQTT broker.")
 
 # --- Main Function ---
+def publish_all(client: mqtt.Client):
+    """Publishes every generated suburb data file over an established connection."""
+    topic_tasks = [
+        (TOPIC_DRIVEWAYS, DRIVEWAYS_CSV),
+        (TOPIC_HOUSES, HOUSES_CSV),
+        (TOPIC_STREETS, STREETS_CSV),
+    ]
+
+    publish_topic_data(client, topic_tasks)
+
+    suburb_payload = get_suburb_payload()
+    if suburb_payload is not None:
+        publish_single_message(client, TOPIC_SUBURB, suburb_payload)
+    else:
+        print(f"No data found in {SUBURB_CSV}. Skipping publishing for this topic.")
+
+    print("\nFinished publishing available data.")
+
 def main():
     client = mqtt.Client()
+    client.max_inflight_messages_set(INFLIGHT_WINDOW)  # Let paho keep the whole window in flight at QoS 1/2
 
     client.on_connect = on_connect
     client.on_disconnect = on_disconnect
@@ -133,36 +260,20 @@ def main():
         print(f"An error occurred during connection: {e}")
         sys.exit(1)
 
-    client.loop_start()
-
+    # The network loop is driven from this thread while waiting on the broker
+    # (see mqtt_common.run_network_until) rather than by loop_start()'s
+    # background thread, which would contend with the publish loop for the GIL.
     print("Waiting for connection...")
-    time.sleep(3)
-    if not client.is_connected():
+    if not wait_for_connection(client):
         print("MQTT client failed to connect. Exiting.")
-        client.loop_stop()
         sys.exit(1)
 
-    parallel_tasks = [
-        (TOPIC_DRIVEWAYS, DRIVEWAYS_CSV),
-        (TOPIC_HOUSES, HOUSES_CSV),
-        (TOPIC_STREETS, STREETS_CSV),
-    ]
-
-    publish_parallel_data(client, parallel_tasks)
-
-    suburb_data_list = read_csv_data(SUBURB_CSV)
-    suburb_data_list = format_location_data(suburb_data_list)
-    if suburb_data_list:
-        if suburb_data_list:
-            publish_single_message(client, TOPIC_SUBURB, suburb_data_list[0])
-        else:
-            print(f"Suburb CSV {SUBURB_CSV} was read but appears empty.")
+    if DAEMON_FLAG in sys.argv[1:]:
+        run_daemon(client)
     else:
-        print(f"No data found in {SUBURB_CSV}. Skipping publishing for this topic.")
+        publish_all(client)
 
-    print("\nFinished publishing available data.")
-    print("Stopping MQTT network loop and disconnecting.")
-    client.loop_stop()
+    print("Disconnecting from MQTT broker.")
     client.disconnect()
     print("MQTT client disconnected.")
 
@@ -12,13 +12,23 @@ MQTT_PORT = 1883
 TOPIC_BASE = "suburb/model/igention/"
 # Subscribe to all subtopics of TOPIC_BASE
 MQTT_TOPIC = TOPIC_BASE + "#"  # '#' is a wildcard in MQTT
+# Set to a group name to join a shared subscription: the broker then splits
+# the messages between all running subscribers in the same group instead of
+# sending every message to each of them.
+SHARED_GROUP = ""
+SUBSCRIPTION = f"$share/{SHARED_GROUP}/{MQTT_TOPIC}" if SHARED_GROUP else MQTT_TOPIC
+PRETTY_PRINT = False  # Decode and indent every JSON payload; too slow to keep up with bulk publishes
+
+# Raw payloads are written straight to stdout's byte stream; flush them per
+# message only when someone is watching the terminal.
+STDOUT_IS_TTY = sys.stdout.isatty()
 
 # --- MQTT Callbacks ---
 def on_connect(client, userdata, flags, rc):
     """Callback function for when the client connects to the MQTT broker."""
     if rc == 0:
         print("Subscriber connected to MQTT broker.")
-        client.subscribe(MQTT_TOPIC)  # Subscribe to the topic
+        client.subscribe(SUBSCRIPTION)  # Subscribe to the topic
     else:
         print(f"Subscriber connection failed with code {rc}")
 
@@ -26,10 +36,24 @@ def on_connect(client, userdata, flags, rc):
 def on_message(client, userdata, msg):
     """Callback function for when a message is received from the MQTT broker."""
 
+    if not PRETTY_PRINT:
+        # Echo the payload bytes as received, skipping the decode/re-encode
+        # round trip that would otherwise run on paho's network thread
+        sys.stdout.buffer.write(msg.topic.encode() + b" " + msg.payload + b"\n")
+        if STDOUT_IS_TTY:
+            sys.stdout.buffer.flush()
+        return
+
     try:
         payload = json.loads(msg.payload.decode())
-        print(f"Received data on topic: {msg.topic}")
-        print(json.dumps(payload, indent=2))  # Pretty-print the JSON
+        if isinstance(payload, list):
+            # Batch topics carry a JSON array of records per message
+            print(f"Received batch of {len(payload)} records on topic: {msg.topic}")
+            for record in payload:
+                print(json.dumps(record, indent=2))
+        else:
+            print(f"Received data on topic: {msg.topic}")
+            print(json.dumps(payload, indent=2))  # Pretty-print the JSON
     except json.JSONDecodeError:
         print(f"Received non-JSON message on topic: {msg.topic} - {msg.payload.decode()}")
     except Exception as e:
@@ -38,7 +62,7 @@ def on_message(client, userdata, msg):
 
 def on_subscribe(client, userdata, mid, granted_qos):
     """Callback for when the client receives a SUBACK response from the broker."""
-    print(f"Subscribed to {MQTT_TOPIC} with QoS: {granted_qos}")
+    print(f"Subscribed to {SUBSCRIPTION} with QoS: {granted_qos}")
 
 
 def on_disconnect(client, userdata, rc):
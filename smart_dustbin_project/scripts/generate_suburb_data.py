@@ -1,8 +1,11 @@
 import csv
 import os
 import random
+import sys
 import time
-from typing import List, Dict, Any
+from typing import Iterable, List, Any, Sequence, Tuple
+
+import numpy as np
 
 # Assume suburb_model directory is in the same directory as this script
 # and contains location.py, driveway.py, house.py, street.py, suburb.py
@@ -12,11 +15,11 @@ try:
     from suburb_model.house import House
     from suburb_model.street import Street
     from suburb_model.suburb import Suburb
-except ImportError:
-    print("Error: Could not import suburb model classes.")
+except ImportError as e:
+    print(f"Error: Could not import suburb model classes: {e}")
     print("Please ensure the 'suburb_model' directory is in the same location")
     print("as this script and contains the necessary Python files.")
-    exit(1)
+    sys.exit(1)
 
 # --- Configuration ---
 DATA_DIR = "generated_suburb_data"
@@ -25,33 +28,71 @@ HOUSES_CSV = os.path.join(DATA_DIR, "houses.csv")
 STREETS_CSV = os.path.join(DATA_DIR, "streets.csv")
 SUBURB_CSV = os.path.join(DATA_DIR, "suburb.csv")
 
+IO_BUFFER_SIZE = 1 << 20 # 1 MiB file buffer for CSV reads and writes
+
+# Simulated locations fall within a general area (e.g., based on Melbourne CBD range)
+# In a real scenario, you'd get these from a map tool or actual data
+BASE_LAT = -37.81
+BASE_LON = 144.96
+LAT_RANGE = 0.02
+LON_RANGE = 0.03
+
 # --- Helper Functions ---
 
 def ensure_data_dir():
     """Ensures the data directory exists."""
     os.makedirs(DATA_DIR, exist_ok=True)
 
-def read_csv(filepath: str) -> List[Dict[str, str]]:
-    """Reads data from a CSV file and returns a list of dictionaries."""
+def read_csv(filepath: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Reads data from a CSV file and returns (header, rows), where each row is a
+    list of values in header order. As with csv.DictReader, blank lines are
+    skipped and short rows are padded with None. Returns ([], []) if the file
+    does not exist.
+    """
     if not os.path.exists(filepath):
-        return []
-    with open(filepath, mode='r', newline='', encoding='utf-8') as infile:
-        reader = csv.DictReader(infile)
-        return list(reader)
-
-def write_csv(filepath: str, data: List[Dict[str, Any]], fieldnames: List[str]):
-    """Writes data (list of dictionaries) to a CSV file."""
+        return [], []
+    with open(filepath, mode='r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as infile:
+        reader = csv.reader(infile)
+        header = next(reader, [])
+        width = len(header)
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+            rows.append(row)
+        return header, rows
+
+def write_csv(filepath: str, rows: Iterable[Sequence[Any]], fieldnames: List[str]):
+    """Writes data (rows ordered like fieldnames) to a CSV file."""
     ensure_data_dir()
-    with open(filepath, mode='w', newline='', encoding='utf-8') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    with open(filepath, mode='w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
     print(f"Data successfully written to {filepath}")
 
 def generate_unique_id(prefix: str) -> str:
     """Generates a simple unique ID using timestamp and random number."""
     return f"{prefix}_{int(time.time() * 1000)}_{random.randint(1000, 9999)}"
 
+def generate_unique_ids(prefix: str, count: int) -> List[str]:
+    """
+    Generates count unique IDs sharing one timestamp, distinguished by a
+    sequence number. The clock is read once per batch rather than per ID, and
+    IDs within a batch cannot collide.
+    """
+    base = int(time.time() * 1000)
+    return [f"{prefix}_{base}_{n}" for n in range(count)]
+
+def simulate_area_locations(rng: np.random.Generator, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Samples count (latitudes, longitudes) uniformly within the simulated area."""
+    lats = BASE_LAT + rng.uniform(-LAT_RANGE/2, LAT_RANGE/2, count)
+    lons = BASE_LON + rng.uniform(-LON_RANGE/2, LON_RANGE/2, count)
+    return lats, lons
+
 # --- Data Generation Functions ---
 
 def generate_driveways():
@@ -67,37 +108,21 @@ def generate_driveways():
         print("Invalid input. Please enter a number.")
         return
 
-    driveway_data = []
     print("Generating driveway locations (simulated)...")
-    # Simulate locations within a general area (e.g., based on Melbourne CBD range)
-    # In a real scenario, you'd get these from a map tool or actual data
-    base_lat = -37.81
-    base_lon = 144.96
-    lat_range = 0.02
-    lon_range = 0.03
-
-    for i in range(num_driveways):
-        driveway_id = generate_unique_id("driveway")
-        # Simulate location slightly varied
-        lat = base_lat + random.uniform(-lat_range/2, lat_range/2)
-        lon = base_lon + random.uniform(-lon_range/2, lon_range/2)
-        location = Location(lat, lon)
-
-        driveway_data.append({
-            "driveway_id": driveway_id,
-            "latitude": location.latitude,
-            "longitude": location.longitude
-        })
+    # Sample every driveway location in one pass
+    rng = np.random.default_rng()
+    lats, lons = simulate_area_locations(rng, num_driveways)
+    driveway_ids = generate_unique_ids("driveway", num_driveways)
 
     fieldnames = ["driveway_id", "latitude", "longitude"]
-    write_csv(DRIVEWAYS_CSV, driveway_data, fieldnames)
+    write_csv(DRIVEWAYS_CSV, zip(driveway_ids, lats.tolist(), lons.tolist()), fieldnames)
 
 def generate_houses():
     """Generates simulated House data and saves to CSV."""
     print("\n--- Generate House Data ---")
 
     # Check for dependency: Driveways
-    driveway_data = read_csv(DRIVEWAYS_CSV)
+    driveway_header, driveway_data = read_csv(DRIVEWAYS_CSV)
     if not driveway_data:
         print("Dependency missing: No driveway data found.")
         print("Please generate Driveway data first using option 2.")
@@ -117,69 +142,40 @@ def generate_houses():
         print("Invalid input. Please enter a number.")
         return
 
-    house_data = []
-    available_driveway_ids = [d['driveway_id'] for d in driveway_data]
-    used_driveway_ids = set()
-
     print("Generating house data (simulated addresses and locations)...")
 
     # Simulate house locations near driveways
     # In a real scenario, you'd get actual addresses and locations
     street_names = ["Main St", "Oak Ave", "Elm Cres", "Pine Ln", "Maple Pde"] # Example names
 
-    for i in range(num_houses):
-        property_id = generate_unique_id("house")
-        address_number = i + 1
-        street_name = random.choice(street_names)
-        address = f"{address_number} {street_name}"
-
-        # Assign a driveway if available and not already used by this house
-        assigned_driveway_id = None
-        if available_driveway_ids:
-             # Simple assignment logic: try to assign one driveway per house
-             # In a real scenario, this mapping would be based on real data
-             potential_driveways = [d for d in driveway_data if d['driveway_id'] not in used_driveway_ids]
-             if potential_driveways:
-                 chosen_driveway = random.choice(potential_driveways)
-                 assigned_driveway_id = chosen_driveway['driveway_id']
-                 used_driveway_ids.add(assigned_driveway_id)
-                 # Simulate house location close to the assigned driveway
-                 house_lat = float(chosen_driveway['latitude']) + random.uniform(-0.0005, 0.0005)
-                 house_lon = float(chosen_driveway['longitude']) + random.uniform(-0.0005, 0.0005)
-                 location = Location(house_lat, house_lon)
-             else:
-                 # If all driveways are used, simulate a location without a specific driveway link
-                 print(f"Warning: Not enough unique driveways for house {i+1}. Simulating location without driveway link.")
-                 base_lat = -37.81
-                 base_lon = 144.96
-                 lat_range = 0.02
-                 lon_range = 0.03
-                 house_lat = base_lat + random.uniform(-lat_range/2, lat_range/2)
-                 house_lon = base_lon + random.uniform(-lon_range/2, lon_range/2)
-                 location = Location(house_lat, house_lon)
-
-        else:
-             # If no driveway data exists (shouldn't happen if dependency check works, but as fallback)
-             print(f"Warning: No driveway data available. Simulating location without driveway link for house {i+1}.")
-             base_lat = -37.81
-             base_lon = 144.96
-             lat_range = 0.02
-             lon_range = 0.03
-             house_lat = base_lat + random.uniform(-lat_range/2, lat_range/2)
-             house_lon = base_lon + random.uniform(-lon_range/2, lon_range/2)
-             location = Location(house_lat, house_lon)
-
-
-        house_data.append({
-            "property_id": property_id,
-            "address": address,
-            "latitude": location.latitude,
-            "longitude": location.longitude,
-            "driveway_ids": assigned_driveway_id if assigned_driveway_id else "" # Store assigned driveway ID
-        })
+    rng = np.random.default_rng()
+    property_ids = generate_unique_ids("house", num_houses)
+    addresses = [f"{i + 1} {street_name}" for i, street_name in enumerate(rng.choice(street_names, num_houses).tolist())]
+
+    # Simple assignment logic: one unique driveway per house, drawn at random
+    # In a real scenario, this mapping would be based on real data
+    num_with_driveway = min(num_houses, len(driveway_data))
+    chosen_driveways = [driveway_data[j] for j in rng.permutation(len(driveway_data))[:num_with_driveway].tolist()]
+    id_i, lat_i, lon_i = (driveway_header.index(field) for field in ("driveway_id", "latitude", "longitude"))
+    assigned_driveway_ids = [d[id_i] for d in chosen_driveways] + [""] * (num_houses - num_with_driveway)
+
+    # Simulate house location close to the assigned driveway
+    house_lats = np.empty(num_houses)
+    house_lons = np.empty(num_houses)
+    house_lats[:num_with_driveway] = np.fromiter((float(d[lat_i]) for d in chosen_driveways), float, num_with_driveway)
+    house_lons[:num_with_driveway] = np.fromiter((float(d[lon_i]) for d in chosen_driveways), float, num_with_driveway)
+    house_lats[:num_with_driveway] += rng.uniform(-0.0005, 0.0005, num_with_driveway)
+    house_lons[:num_with_driveway] += rng.uniform(-0.0005, 0.0005, num_with_driveway)
+
+    num_without_driveway = num_houses - num_with_driveway
+    if num_without_driveway:
+        # If all driveways are used, simulate a location without a specific driveway link
+        print(f"Warning: Not enough unique driveways for houses {num_with_driveway + 1}-{num_houses}. Simulating locations without driveway link.")
+        house_lats[num_with_driveway:], house_lons[num_with_driveway:] = simulate_area_locations(rng, num_without_driveway)
 
     fieldnames = ["property_id", "address", "latitude", "longitude", "driveway_ids"]
-    write_csv(HOUSES_CSV, house_data, fieldnames)
+    house_rows = zip(property_ids, addresses, house_lats.tolist(), house_lons.tolist(), assigned_driveway_ids)
+    write_csv(HOUSES_CSV, house_rows, fieldnames)
 
 
 def generate_streets():
@@ -187,7 +183,7 @@ def generate_streets():
     print("\n--- Generate Street Data ---")
 
     # Check for dependency: Houses
-    house_data = read_csv(HOUSES_CSV)
+    house_header, house_data = read_csv(HOUSES_CSV)
     if not house_data:
         print("Dependency missing: No house data found.")
         print("Please generate House data first using option 3.")
@@ -204,8 +200,10 @@ def generate_streets():
         return
 
     street_data = []
-    all_house_ids = [h['property_id'] for h in house_data]
-    random.shuffle(all_house_ids) # Shuffle to distribute houses randomly
+    rng = random.Random() # One generator instance for all sampling in this run
+    property_id_i = house_header.index("property_id")
+    all_house_ids = [h[property_id_i] for h in house_data]
+    rng.shuffle(all_house_ids) # Shuffle to distribute houses randomly
 
     # Simple assignment: Divide houses roughly equally among streets
     houses_per_street = len(all_house_ids) // num_streets if num_streets > 0 else 0
@@ -220,10 +218,10 @@ def generate_streets():
         while len(street_names) < num_streets:
             street_names.extend(["Street" + str(i) for i in range(num_streets)]) # Fallback generic names
 
-    random.shuffle(street_names) # Shuffle names
+    rng.shuffle(street_names) # Shuffle names
+    street_ids = generate_unique_ids("street", num_streets)
 
-    for i in range(num_streets):
-        street_id = generate_unique_id("street")
+    for i, street_id in enumerate(street_ids):
         street_name = street_names[i % len(street_names)] # Use modulo for repeating names
 
         # Assign houses to this street
@@ -232,11 +230,11 @@ def generate_streets():
         assigned_house_ids = all_house_ids[start_index:end_index]
         start_index = end_index
 
-        street_data.append({
-            "street_id": street_id,
-            "name": street_name,
-            "house_ids": ",".join(assigned_house_ids) # Store house IDs as comma-separated string
-        })
+        street_data.append((
+            street_id,
+            street_name,
+            ",".join(assigned_house_ids) # Store house IDs as comma-separated string
+        ))
 
     fieldnames = ["street_id", "name", "house_ids"]
     write_csv(STREETS_CSV, street_data, fieldnames)
@@ -247,7 +245,7 @@ def generate_suburb():
     print("\n--- Generate Suburb Data ---")
 
     # Check for dependency: Streets
-    street_data = read_csv(STREETS_CSV)
+    street_header, street_data = read_csv(STREETS_CSV)
     if not street_data:
         print("Dependency missing: No street data found.")
         print("Please generate Street data first using option 4.")
@@ -259,13 +257,14 @@ def generate_suburb():
         return
 
     suburb_id = generate_unique_id("suburb")
-    all_street_ids = [s['street_id'] for s in street_data]
+    street_id_i = street_header.index("street_id")
+    all_street_ids = [s[street_id_i] for s in street_data]
 
-    suburb_data = [{
-        "suburb_id": suburb_id,
-        "name": suburb_name,
-        "street_ids": ",".join(all_street_ids) # Store street IDs as comma-separated string
-    }]
+    suburb_data = [(
+        suburb_id,
+        suburb_name,
+        ",".join(all_street_ids) # Store street IDs as comma-separated string
+    )]
 
     fieldnames = ["suburb_id", "name", "street_ids"]
     write_csv(SUBURB_CSV, suburb_data, fieldnames)
@@ -281,10 +280,10 @@ def view_generated_data():
         "Suburb": SUBURB_CSV
     }
     for name, filepath in files.items():
-        data = read_csv(filepath)
+        header, data = read_csv(filepath)
         print(f"{name}: {len(data)} records found in {filepath}")
         if data:
-            print("  Sample record:", data[0])
+            print("  Sample record:", dict(zip(header, data[0])))
         else:
             print("  No data generated yet.")
     print("-" * 30)
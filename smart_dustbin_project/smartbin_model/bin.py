@@ -2,6 +2,7 @@ import datetime
 import json
 import random
 import time
+from typing import Optional
 
 class bin:
     """
@@ -11,6 +12,11 @@ class bin:
     independently in various projects for testing or simulation purposes.
     It generates data points resembling those from a real smart bin sensor.
     """
+    __slots__ = ("_bin_id", "_latitude", "_longitude", "_fill_level", "_fill_rate_per_second",
+                 "_update_interval_seconds", "_status", "_temperature_celsius",
+                 "_fill_variation_percentage", "_temp_variation_celsius", "_random",
+                 "_last_update_time", "_json_prefix", "_json_location", "_json_status")
+
 
     def __init__(self,
                  bin_id: str,
@@ -22,7 +28,8 @@ class bin:
                  initial_status: str = "online",
                  initial_temperature_celsius: float = 20.0,
                  fill_variation_percentage: float = 0.5, # Max random variation in fill per interval
-                 temp_variation_celsius: float = 0.2 # Max random variation in temp per interval
+                 temp_variation_celsius: float = 0.2, # Max random variation in temp per interval
+                 seed: Optional[int] = None
                 ):
         """
         Initializes the bin for a specific bin.
@@ -46,6 +53,8 @@ class bin:
                                                Defaults to 0.5.
             temp_variation_celsius (float): Maximum random degrees Celsius to add/subtract
                                             to temperature per interval. Defaults to 0.2.
+            seed (int, optional): Seed for the bin's own random number generator,
+                                  for reproducible simulations. Defaults to None.
         """
         if not 0.0 <= initial_fill_level <= 100.0:
             raise ValueError("initial_fill_level must be between 0.0 and 100.0")
@@ -62,10 +71,21 @@ class bin:
         self._temperature_celsius = initial_temperature_celsius
         self._fill_variation_percentage = fill_variation_percentage
         self._temp_variation_celsius = temp_variation_celsius
+        # A generator per bin rather than the shared module-level one, so each
+        # bin's variations can be seeded and reproduced independently
+        self._random = random.Random(seed)
 
         self._last_update_time = datetime.datetime.now(datetime.timezone.utc)
 
-    def generate_data_point(self) -> dict:
+        # JSON fragments for the fields that rarely change, reused by
+        # generate_data_point_bytes. They are encoded on first use (see
+        # _encode_json_fields) so building a large fleet of bins that never
+        # publish bytes doesn't pay for them.
+        self._json_prefix = None
+        self._json_location = None
+        self._json_status = None
+
+    def generate_data_point(self, current_time: Optional[datetime.datetime] = None) -> dict:
         """
         Generates a single simulated data point for the bin based on the
         current state and time elapsed.
@@ -73,42 +93,81 @@ class bin:
         Simulates the fill level increasing over time with some random variation,
         and also simulates temperature variation.
 
+        Parameters:
+            current_time (datetime.datetime, optional): The (timezone-aware UTC)
+                                        time of this data point. Pass the same value
+                                        to a batch of bins to read the clock once per
+                                        batch. Defaults to the current time.
+
         Returns:
             dict: A dictionary containing the simulated bin data in a
                   JSON-like structure.
         """
-        current_time = datetime.datetime.now(datetime.timezone.utc)
+        current_time = self._advance(current_time)
+
+        # Construct the data payload
+        data_payload = {
+            "binId": self._bin_id,
+            "timestamp": current_time.isoformat(),
+            "location": {
+                "latitude": self._latitude,
+                "longitude": self._longitude
+            },
+            "fillLevelPercentage": round(self._fill_level, 2), # Round for cleaner output
+            "status": self._status,
+            "temperatureCelsius": round(self._temperature_celsius, 2) # Round for cleaner output
+        }
+
+        return data_payload
+
+    def _advance(self, current_time: Optional[datetime.datetime]) -> datetime.datetime:
+        """Advances the simulated fill level and temperature to current_time and returns it."""
+        if current_time is None:
+            current_time = datetime.datetime.now(datetime.timezone.utc)
         time_elapsed = (current_time - self._last_update_time).total_seconds()
 
         # Simulate fill level increase with variation
         fill_increase = time_elapsed * self._fill_rate_per_second
-        random_fill_variation = random.uniform(-self._fill_variation_percentage, self._fill_variation_percentage)
+        random_fill_variation = self._random.uniform(-self._fill_variation_percentage, self._fill_variation_percentage)
         self._fill_level += fill_increase + random_fill_variation
 
         # Ensure fill level stays within 0 and 100
         self._fill_level = max(0.0, min(100.0, self._fill_level))
 
         # Simulate temperature variation
-        random_temp_variation = random.uniform(-self._temp_variation_celsius, self._temp_variation_celsius)
+        random_temp_variation = self._random.uniform(-self._temp_variation_celsius, self._temp_variation_celsius)
         self._temperature_celsius += random_temp_variation
 
         # Update the last update time
         self._last_update_time = current_time
+        return current_time
 
-        # Construct the data payload
-        data_payload = {
-            "binId": self._bin_id,
-            "timestamp": current_time.isoformat(),
-            "location": {
-                "latitude": self._latitude,
-                "longitude": self._longitude
-            },
-            "fillLevelPercentage": round(self._fill_level, 2), # Round for cleaner output
-            "status": self._status,
-            "temperatureCelsius": round(self._temperature_celsius, 2) # Round for cleaner output
-        }
+    def generate_data_point_bytes(self, current_time: Optional[datetime.datetime] = None) -> bytes:
+        """
+        Generates the next data point, as generate_data_point does, encoded as
+        compact JSON bytes that can be published as an MQTT payload directly.
+        The text is formatted from pre-encoded static fields rather than by
+        building and serializing a dict.
 
-        return data_payload
+        Parameters:
+            current_time (datetime.datetime, optional): See generate_data_point.
+
+        Returns:
+            bytes: The UTF-8 JSON encoding of the data point.
+        """
+        if self._json_status is None:
+            self._encode_json_fields()
+        current_time = self._advance(current_time)
+        return (f'{self._json_prefix}{current_time.isoformat()}{self._json_location}'
+                f'{self._fill_level:.2f},"status":{self._json_status},'
+                f'"temperatureCelsius":{self._temperature_celsius:.2f}}}').encode("utf-8")
+
+    def _encode_json_fields(self):
+        """Encodes the JSON fragments used by generate_data_point_bytes for the ID, location and status."""
+        self._json_prefix = '{"binId":%s,"timestamp":"' % json.dumps(self._bin_id)
+        self._json_location = '","location":{"latitude":%s,"longitude":%s},"fillLevelPercentage":' % (
+            json.dumps(self._latitude), json.dumps(self._longitude))
+        self._json_status = json.dumps(self._status)
 
     def get_bin_id(self) -> str:
         """Returns the unique identifier of the bin."""
@@ -129,6 +188,7 @@ class bin:
     def set_status(self, status: str):
         """Sets the simulated status of the bin."""
         self._status = status
+        self._json_status = None # Re-encoded on the next generate_data_point_bytes call
 
 # Example Usage (can be run directly for testing)
 if __name__ == "__main__":
@@ -146,11 +206,18 @@ if __name__ == "__main__":
     print(f"Location: {melbourne_bin_simulator.get_location()}")
 
     try:
-        # Generate data points over a short period
+        # Generate data points over a short period. Ticks are scheduled on the
+        # monotonic clock so the time spent generating and printing doesn't
+        # push every later data point back.
+        interval = melbourne_bin_simulator._update_interval_seconds
+        next_tick = time.monotonic()
         for i in range(10):
             data_point = melbourne_bin_simulator.generate_data_point()
             print(json.dumps(data_point, indent=2)) # Print as formatted JSON
-            time.sleep(melbourne_bin_simulator._update_interval_seconds) # Wait for the next interval
+            next_tick += interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for) # Wait for the next interval
 
         # Simulate a status change
         melbourne_bin_simulator.set_status("low battery")
@@ -0,0 +1,217 @@
+import datetime
+from enum import IntEnum
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+# A per-bin parameter: either one value shared by every bin or one value per bin.
+PerBin = Union[float, Sequence[float], np.ndarray]
+
+# Precision of the constant per-bin parameters (fill rates and variation
+# ranges) and of the per-tick random draws. float32 halves their memory and
+# each value is only ever rounded once. Fill levels and temperatures stay
+# float64: they accumulate many small per-tick increments, and float32
+# rounding error would build up over a long simulation. Coordinates also
+# stay float64 (float32 would be ~1 m off).
+PARAM_DTYPE = np.float32
+
+class BinStatus(IntEnum):
+    """Operational status of a bin; BinFleet stores it as one byte per bin."""
+    ONLINE = 0
+    OFFLINE = 1
+    LOW_BATTERY = 2
+    FAULT = 3
+
+    @property
+    def label(self) -> str:
+        """The status text used in data point payloads, e.g. "low battery"."""
+        return self.name.lower().replace("_", " ")
+
+    @classmethod
+    def from_label(cls, status: Union[str, int]) -> "BinStatus":
+        """Returns the BinStatus for a payload label such as "online" (or a status code)."""
+        if isinstance(status, (int, np.integer)):  # Includes the uint8 codes BinFleet stores
+            return cls(int(status))
+        try:
+            return cls[status.upper().replace(" ", "_")]
+        except KeyError:
+            raise ValueError(f"Unknown bin status: {status!r}") from None
+
+# Payload text for each status code, so a whole fleet's statuses can be
+# translated with one array lookup
+STATUS_LABELS = np.array([status.label for status in BinStatus], dtype=object)
+
+def _per_bin(values: PerBin, count: int, dtype=PARAM_DTYPE) -> np.ndarray:
+    """Returns values as a writable array of dtype with one entry per bin."""
+    return np.broadcast_to(np.asarray(values, dtype=dtype), (count,)).copy()
+
+class BinFleet:
+    """
+    A class to simulate data generation for many smart dustbins at once.
+
+    It follows the same model as `bin`, but keeps each per-bin quantity in a
+    NumPy array (one entry per bin) instead of one object per dustbin, so a
+    simulation tick for thousands of bins is a few vectorized operations
+    rather than a Python-level loop over `bin.generate_data_point` calls.
+    """
+
+    def __init__(self,
+                 bin_ids: Sequence[str],
+                 latitudes: PerBin,
+                 longitudes: PerBin,
+                 initial_fill_levels: PerBin = 0.0,
+                 fill_rates_per_hour: PerBin = 1.0, # Average percentage points increase per hour
+                 initial_status: Union[str, BinStatus] = BinStatus.ONLINE,
+                 initial_temperatures_celsius: PerBin = 20.0,
+                 fill_variation_percentage: PerBin = 0.5, # Max random variation in fill per tick
+                 temp_variation_celsius: PerBin = 0.2, # Max random variation in temp per tick
+                 seed: Optional[int] = None
+                ):
+        """
+        Initializes the fleet.
+
+        Each numeric parameter may be a single value applied to every bin or a
+        sequence/array with one value per bin (in the order of bin_ids).
+
+        Parameters:
+            bin_ids (Sequence[str]): Unique identifiers for the bins.
+            latitudes: The latitude of each bin's location.
+            longitudes: The longitude of each bin's location.
+            initial_fill_levels: Starting fill level percentages (0.0 to 100.0).
+                                 Defaults to 0.0.
+            fill_rates_per_hour: The average rate at which each bin fills in
+                                 percentage points per hour. Defaults to 1.0.
+            initial_status (str or BinStatus): The initial operational status of
+                                  every bin, as a BinStatus or its payload label.
+                                  Defaults to BinStatus.ONLINE ("online").
+            initial_temperatures_celsius: The initial temperature inside each bin.
+                                          Defaults to 20.0.
+            fill_variation_percentage: Maximum random percentage points to
+                                       add/subtract to fill levels per tick.
+                                       Defaults to 0.5.
+            temp_variation_celsius: Maximum random degrees Celsius to add/subtract
+                                    to temperatures per tick. Defaults to 0.2.
+            seed (int, optional): Seed for the fleet's random number generator,
+                                  for reproducible simulations. Defaults to None.
+        """
+        count = len(bin_ids)
+        self._bin_ids = list(bin_ids)
+        self._latitudes = _per_bin(latitudes, count, np.float64)
+        self._longitudes = _per_bin(longitudes, count, np.float64)
+        self._fill_levels = _per_bin(initial_fill_levels, count, np.float64)
+        self._fill_rates_per_second = _per_bin(fill_rates_per_hour, count) / 3600.0 # Convert rates to per second
+        self._statuses = np.full(count, BinStatus.from_label(initial_status), dtype=np.uint8)
+        self._temperatures_celsius = _per_bin(initial_temperatures_celsius, count, np.float64)
+        self._fill_variation_percentage = _per_bin(fill_variation_percentage, count)
+        self._temp_variation_celsius = _per_bin(temp_variation_celsius, count)
+
+        if ((self._fill_levels < 0.0) | (self._fill_levels > 100.0)).any():
+            raise ValueError("initial_fill_levels must be between 0.0 and 100.0")
+
+        self._rng = np.random.default_rng(seed)
+        self._last_update_time = datetime.datetime.now(datetime.timezone.utc)
+
+    def __len__(self) -> int:
+        """Returns the number of bins in the fleet."""
+        return len(self._bin_ids)
+
+    def tick(self, current_time: Optional[datetime.datetime] = None):
+        """
+        Advances every bin's simulated state to current_time: fill levels rise
+        by each bin's fill rate over the elapsed time plus random variation
+        (clamped to 0-100), and temperatures drift randomly.
+
+        Parameters:
+            current_time (datetime.datetime, optional): The (timezone-aware UTC)
+                                        time to advance to. Defaults to the
+                                        current time.
+        """
+        if current_time is None:
+            current_time = datetime.datetime.now(datetime.timezone.utc)
+        time_elapsed = (current_time - self._last_update_time).total_seconds()
+        count = len(self._bin_ids)
+
+        self._fill_levels += time_elapsed * self._fill_rates_per_second
+        self._fill_levels += self._uniform_variation(count) * self._fill_variation_percentage
+        np.clip(self._fill_levels, 0.0, 100.0, out=self._fill_levels)
+
+        self._temperatures_celsius += self._uniform_variation(count) * self._temp_variation_celsius
+
+        self._last_update_time = current_time
+
+    def _uniform_variation(self, count: int) -> np.ndarray:
+        """Draws count samples uniformly from [-1, 1), directly in PARAM_DTYPE."""
+        return self._rng.random(count, dtype=PARAM_DTYPE) * 2.0 - 1.0
+
+    def generate_data_points(self, current_time: Optional[datetime.datetime] = None) -> List[dict]:
+        """
+        Advances the fleet by one tick (see tick) and returns one data point
+        per bin, in the same structure as `bin.generate_data_point`.
+
+        Parameters:
+            current_time (datetime.datetime, optional): See tick.
+
+        Returns:
+            List[dict]: The simulated data point for each bin, in bin_ids order.
+        """
+        self.tick(current_time)
+        timestamp = self._last_update_time.isoformat()
+
+        return [
+            {
+                "binId": bin_id,
+                "timestamp": timestamp,
+                "location": {
+                    "latitude": latitude,
+                    "longitude": longitude
+                },
+                "fillLevelPercentage": fill_level,
+                "status": status,
+                "temperatureCelsius": temperature
+            }
+            for bin_id, latitude, longitude, fill_level, status, temperature in zip(
+                self._bin_ids,
+                self._latitudes.tolist(),
+                self._longitudes.tolist(),
+                np.round(self._fill_levels, 2).tolist(), # Round for cleaner output
+                STATUS_LABELS[self._statuses].tolist(),
+                np.round(self._temperatures_celsius, 2).tolist(),
+            )
+        ]
+
+    def get_bin_ids(self) -> List[str]:
+        """Returns the identifiers of the bins in the fleet."""
+        return self._bin_ids
+
+    def get_current_fill_levels(self) -> np.ndarray:
+        """Returns the current simulated fill level percentage of every bin."""
+        return self._fill_levels
+
+    def get_status(self, index: int) -> BinStatus:
+        """Returns the current simulated status of the bin at index."""
+        return BinStatus(self._statuses[index])
+
+    def set_status(self, index: int, status: Union[str, BinStatus]):
+        """Sets the simulated status of the bin at index (a BinStatus or its payload label)."""
+        self._statuses[index] = BinStatus.from_label(status)
+
+    def get_bins_with_status(self, status: Union[str, BinStatus]) -> np.ndarray:
+        """Returns the indices of the bins currently in the given status."""
+        return np.flatnonzero(self._statuses == BinStatus.from_label(status))
+
+# Example Usage (can be run directly for testing)
+if __name__ == "__main__":
+    import json
+
+    fleet = BinFleet(
+        bin_ids=[f"MEL-CBD-{i:03d}" for i in range(1, 1001)],
+        latitudes=np.linspace(-37.82, -37.80, 1000),
+        longitudes=np.linspace(144.95, 144.97, 1000),
+        initial_fill_levels=10.0,
+        fill_rates_per_hour=5.0,
+        seed=42
+    )
+
+    print(f"Simulating a fleet of {len(fleet)} bins")
+    data_points = fleet.generate_data_points()
+    print(json.dumps(data_points[0], indent=2))
@@ -7,6 +7,8 @@ class Driveway:
     """
     Represents a driveway, typically an access point for bin placement.
     """
+    __slots__ = ("location", "identifier")
+
     def __init__(self, location: Location, identifier: str = None):
         """
         Initializes a Driveway object.
@@ -16,11 +18,11 @@ class Driveway:
             identifier (str, optional): A unique identifier for the driveway if needed.
                                         Defaults to None.
         """
-        if not isinstance(location, Location):
+        if __debug__ and not isinstance(location, Location):
             raise TypeError("Location must be a Location object.")
 
-        self.location: Location = location
-        self.identifier: str = identifier if identifier is not None else f"driveway_{id(self)}" # Simple unique ID
+        self.location = location
+        self.identifier = identifier if identifier is not None else f"driveway_{id(self)}" # Simple unique ID
 
     def __str__(self) -> str:
         """Returns a string representation of the driveway."""
@@ -1,7 +1,7 @@
 # house.py
 # Represents an individual house/property
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from .location import Location
 from .driveway import Driveway
 
@@ -9,6 +9,8 @@ class House:
     """
     Represents an individual house or property.
     """
+    __slots__ = ("address", "location", "property_id", "driveways")
+
     def __init__(self,
                  address: str,
                  location: Location,
@@ -25,18 +27,18 @@ class House:
             driveways (List[Driveway], optional): A list of Driveway objects associated
                                                  with the house. Defaults to None.
         """
-        if not isinstance(address, str) or not address:
+        if (__debug__ and not isinstance(address, str)) or not address:
             raise ValueError("Address must be a non-empty string.")
-        if not isinstance(location, Location):
+        if __debug__ and not isinstance(location, Location):
             raise TypeError("Location must be a Location object.")
-        if driveways is not None and not all(isinstance(d, Driveway) for d in driveways):
+        if __debug__ and driveways is not None and not all(isinstance(d, Driveway) for d in driveways):
              raise TypeError("Driveways must be a list of Driveway objects.")
 
 
-        self.address: str = address
-        self.location: Location = location
-        self.property_id: str = property_id if property_id is not None else f"prop_{id(self)}" # Simple unique ID
-        self.driveways: List[Driveway] = driveways if driveways is not None else []
+        self.address = address
+        self.location = location
+        self.property_id = property_id if property_id is not None else f"prop_{id(self)}" # Simple unique ID
+        self.driveways = driveways if driveways is not None else []
 
     def __str__(self) -> str:
         """Returns a string representation of the house."""
@@ -52,6 +54,16 @@ class House:
             raise TypeError("Can only add Driveway objects.")
         self.driveways.append(driveway)
 
+    def extend_driveways(self, driveways: Iterable[Driveway]):
+        """
+        Adds several driveways to the house at once. The whole batch is
+        type-checked in one pass before any are added.
+        """
+        driveways = list(driveways)
+        if not all(isinstance(d, Driveway) for d in driveways):
+            raise TypeError("Can only add Driveway objects.")
+        self.driveways.extend(driveways)
+
     def get_address(self) -> str:
         """Returns the address of the house."""
         return self.address
@@ -5,6 +5,8 @@ class Location:
     """
     Represents a geographical location with latitude and longitude.
     """
+    __slots__ = ("latitude", "longitude")
+
     def __init__(self, latitude: float, longitude: float):
         """
         Initializes a Location object.
@@ -13,13 +15,13 @@ class Location:
             latitude (float): The latitude coordinate.
             longitude (float): The longitude coordinate.
         """
-        if not isinstance(latitude, (int, float)):
+        if __debug__ and not isinstance(latitude, (int, float)):
             raise TypeError("Latitude must be a number.")
-        if not isinstance(longitude, (int, float)):
+        if __debug__ and not isinstance(longitude, (int, float)):
             raise TypeError("Longitude must be a number.")
 
-        self.latitude: float = latitude
-        self.longitude: float = longitude
+        self.latitude = latitude
+        self.longitude = longitude
 
     def __str__(self) -> str:
         """Returns a string representation of the location."""
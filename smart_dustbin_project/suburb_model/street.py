@@ -1,7 +1,7 @@
 # street.py
 # Represents a street within the suburb
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from .house import House
 from .location import Location # Although street might not have a single point location, useful for segments
 
@@ -9,6 +9,8 @@ class Street:
     """
     Represents a street, containing multiple houses.
     """
+    __slots__ = ("name", "street_id", "houses")
+
     def __init__(self, name: str, street_id: str = None, houses: Optional[List[House]] = None):
         """
         Initializes a Street object.
@@ -19,14 +21,14 @@ class Street:
             houses (List[House], optional): A list of House objects located on the street.
                                            Defaults to None.
         """
-        if not isinstance(name, str) or not name:
+        if (__debug__ and not isinstance(name, str)) or not name:
             raise ValueError("Street name must be a non-empty string.")
-        if houses is not None and not all(isinstance(h, House) for h in houses):
+        if __debug__ and houses is not None and not all(isinstance(h, House) for h in houses):
              raise TypeError("Houses must be a list of House objects.")
 
-        self.name: str = name
-        self.street_id: str = street_id if street_id is not None else f"street_{id(self)}" # Simple unique ID
-        self.houses: List[House] = houses if houses is not None else []
+        self.name = name
+        self.street_id = street_id if street_id is not None else f"street_{id(self)}" # Simple unique ID
+        self.houses = houses if houses is not None else []
         # Could add attributes for street geometry (e.g., a list of Location points) in the future
 
     def __str__(self) -> str:
@@ -34,7 +36,15 @@ class Street:
         return f"Street(id={self.street_id}, name='{self.name}')"
 
     def __repr__(self) -> str:
-        """Returns a developer-friendly string representation."""
+        """
+        Returns a developer-friendly string representation. Only the number of
+        houses is shown, so the cost doesn't grow with the street; use dump()
+        for the full nested representation.
+        """
+        return f"Street(name='{self.name}', street_id='{self.street_id}', num_houses={len(self.houses)})"
+
+    def dump(self) -> str:
+        """Returns the full representation of the street, including every house."""
         return f"Street(name='{self.name}', street_id='{self.street_id}', houses={repr(self.houses)})"
 
     def add_house(self, house: House):
@@ -43,6 +53,17 @@ class Street:
             raise TypeError("Can only add House objects.")
         self.houses.append(house)
 
+    def extend_houses(self, houses: Iterable[House]):
+        """
+        Adds several houses to the street at once. The whole batch is type-checked
+        in one pass before any are added, so bulk loads avoid a separate
+        add_house call per house.
+        """
+        houses = list(houses)
+        if not all(isinstance(h, House) for h in houses):
+            raise TypeError("Can only add House objects.")
+        self.houses.extend(houses)
+
     def get_name(self) -> str:
         """Returns the name of the street."""
         return self.name
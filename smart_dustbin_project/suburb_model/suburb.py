@@ -1,14 +1,28 @@
 # suburb.py
 # Represents the entire suburb area
 
-from typing import List, Optional
+from collections import namedtuple
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
 from .street import Street
 from .house import House # Import House to potentially get all houses easily
 
+EARTH_RADIUS_METERS = 6371000.0 # Mean Earth radius used for distance calculations
+
+# Column-oriented snapshot of a suburb's houses: one array per field, indexed
+# by house in get_all_houses() order. street_indices refers to Suburb.streets.
+HouseArrays = namedtuple("HouseArrays", "property_ids lats lons street_indices")
+
 class Suburb:
     """
     Represents an entire suburb area, containing multiple streets.
     """
+    __slots__ = ("name", "suburb_id", "streets")
+
     def __init__(self, name: str, suburb_id: str = None, streets: Optional[List[Street]] = None):
         """
         Initializes a Suburb object.
@@ -19,14 +33,14 @@ class Suburb:
             streets (List[Street], optional): A list of Street objects within the suburb.
                                             Defaults to None.
         """
-        if not isinstance(name, str) or not name:
+        if (__debug__ and not isinstance(name, str)) or not name:
             raise ValueError("Suburb name must be a non-empty string.")
-        if streets is not None and not all(isinstance(s, Street) for s in streets):
+        if __debug__ and streets is not None and not all(isinstance(s, Street) for s in streets):
              raise TypeError("Streets must be a list of Street objects.")
 
-        self.name: str = name
-        self.suburb_id: str = suburb_id if suburb_id is not None else f"suburb_{id(self)}" # Simple unique ID
-        self.streets: List[Street] = streets if streets is not None else []
+        self.name = name
+        self.suburb_id = suburb_id if suburb_id is not None else f"suburb_{id(self)}" # Simple unique ID
+        self.streets = streets if streets is not None else []
         # Could add boundaries (e.g., a polygon of Location points) in the future
 
     def __str__(self) -> str:
@@ -34,8 +48,17 @@ class Suburb:
         return f"Suburb(id={self.suburb_id}, name='{self.name}')"
 
     def __repr__(self) -> str:
-        """Returns a developer-friendly string representation."""
-        return f"Suburb(name='{self.name}', suburb_id='{self.suburb_id}', streets={repr(self.streets)})"
+        """
+        Returns a developer-friendly string representation. Only the number of
+        streets is shown, so the cost doesn't grow with the suburb; use dump()
+        for the full nested representation.
+        """
+        return f"Suburb(name='{self.name}', suburb_id='{self.suburb_id}', num_streets={len(self.streets)})"
+
+    def dump(self) -> str:
+        """Returns the full representation of the suburb, including every street and house."""
+        streets = ", ".join(street.dump() for street in self.streets)
+        return f"Suburb(name='{self.name}', suburb_id='{self.suburb_id}', streets=[{streets}])"
 
     def add_street(self, street: Street):
         """Adds a street to the suburb."""
@@ -43,6 +66,16 @@ class Suburb:
             raise TypeError("Can only add Street objects.")
         self.streets.append(street)
 
+    def extend_streets(self, streets: Iterable[Street]):
+        """
+        Adds several streets to the suburb at once. The whole batch is
+        type-checked in one pass before any are added.
+        """
+        streets = list(streets)
+        if not all(isinstance(s, Street) for s in streets):
+            raise TypeError("Can only add Street objects.")
+        self.streets.extend(streets)
+
     def get_name(self) -> str:
         """Returns the name of the suburb."""
         return self.name
@@ -53,10 +86,48 @@ class Suburb:
 
     def get_all_houses(self) -> List[House]:
         """Returns a flattened list of all houses in the suburb."""
-        all_houses = []
-        for street in self.streets:
-            all_houses.extend(street.get_houses())
-        return all_houses
+        return list(chain.from_iterable(street.houses for street in self.streets))
+
+    def get_house_arrays(self) -> HouseArrays:
+        """
+        Returns a column-oriented snapshot of every house in the suburb, with
+        coordinates as contiguous float64 arrays. Bulk spatial queries (see
+        houses_within_radius) then run as array operations instead of walking
+        Street and House objects. The snapshot is not updated when houses or
+        streets are added later; take a new one after changing the suburb.
+
+        Requires numpy, which is imported here so the model classes themselves
+        stay dependency-free.
+        """
+        import numpy as np
+
+        houses = self.get_all_houses()
+        count = len(houses)
+        return HouseArrays(
+            property_ids=np.array([house.property_id for house in houses], dtype=object),
+            lats=np.fromiter((house.location.latitude for house in houses), dtype=np.float64, count=count),
+            lons=np.fromiter((house.location.longitude for house in houses), dtype=np.float64, count=count),
+            street_indices=np.repeat(
+                np.arange(len(self.streets), dtype=np.int32),
+                [len(street.houses) for street in self.streets],
+            ),
+        )
+
+def houses_within_radius(houses: HouseArrays, latitude: float, longitude: float, radius_meters: float) -> "np.ndarray":
+    """
+    Returns the indices (into the HouseArrays columns) of the houses within
+    radius_meters of the given point, using the haversine great-circle distance.
+    Requires numpy.
+    """
+    import numpy as np
+
+    lat1 = np.radians(latitude)
+    lats = np.radians(houses.lats)
+    half_dlat = (lats - lat1) / 2.0
+    half_dlon = np.radians(houses.lons - longitude) / 2.0
+    a = np.sin(half_dlat) ** 2 + np.cos(lat1) * np.cos(lats) * np.sin(half_dlon) ** 2
+    distances = 2.0 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(a))
+    return np.flatnonzero(distances <= radius_meters)
 
 
 # Example Usage (optional)
@@ -84,3 +155,7 @@ if __name__ == "__main__":
     print(suburb1)
     print(f"Streets in {suburb1.get_name()}: {[s.get_name() for s in suburb1.get_streets()]}")
     print(f"All houses in {suburb1.get_name()}: {[h.get_address() for h in suburb1.get_all_houses()]}")
+
+    house_arrays = suburb1.get_house_arrays()
+    nearby = houses_within_radius(house_arrays, -37.8140, 144.9640, 50.0)
+    print(f"Houses within 50 m of house_123: {house_arrays.property_ids[nearby].tolist()}")
@@ -13,9 +13,16 @@ client = mqtt.Client()
 # Connect to broker
 client.connect(broker, port, 60)
 
+# Handle network traffic (keepalive pings, acks) in a background thread so
+# the connection stays up between the publishes below
+client.loop_start()
+
+# The message never changes, so encode it to bytes once up front
+message = "Hello from publisher!"
+payload = message.encode("utf-8")
+
 # Publish a message
 while True:
-    message = "Hello from publisher!"
-    client.publish(topic, message)
+    client.publish(topic, payload)
     print(f"Published: {message}")
     time.sleep(2)  # Publish every 2 seconds
\ No newline at end of file